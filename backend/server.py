@@ -1,6 +1,7 @@
-from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File
+from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Query
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
@@ -8,7 +9,7 @@ from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Optional
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 import json
 
 
@@ -66,7 +67,7 @@ class InterviewSessionCreate(BaseModel):
 
 class InterviewReport(BaseModel):
     session: InterviewSession
-    events: List[DetectionEvent]
+    events: Optional[List[DetectionEvent]] = None
     summary: dict
 
 # Routes
@@ -169,7 +170,11 @@ async def get_events(session_id: str):
 
 # Reports
 @api_router.get("/reports/{session_id}", response_model=InterviewReport)
-async def get_report(session_id: str):
+async def get_report(
+    session_id: str,
+    resolution: Optional[int] = Query(None, ge=1, description="Timeline bucket size in seconds"),
+    include_events: bool = False
+):
     # Get session
     session = await db.interview_sessions.find_one({"id": session_id})
     if not session:
@@ -189,11 +194,11 @@ async def get_report(session_id: str):
         parsed_events.append(DetectionEvent(**event))
     
     # Generate summary
-    summary = generate_report_summary(parsed_events)
+    summary = generate_report_summary(parsed_events, resolution, session['start_time'])
     
     return InterviewReport(
         session=InterviewSession(**session),
-        events=parsed_events,
+        events=parsed_events if include_events else None,
         summary=summary
     )
 
@@ -223,8 +228,13 @@ def calculate_integrity_score(events):
     
     return max(0, base_score)
 
-def generate_report_summary(events):
-    """Generate summary statistics from events"""
+def generate_report_summary(events, resolution=None, start_time=None):
+    """Generate summary statistics from events.
+
+    When ``resolution`` (seconds) is given, the timeline holds per-type event
+    counts for each ``resolution``-second bucket since ``start_time`` instead
+    of one entry per event.
+    """
     summary = {
         'total_events': len(events),
         'focus_lost_count': 0,
@@ -234,6 +244,8 @@ def generate_report_summary(events):
         'detected_objects': [],
         'timeline': []
     }
+    origin = start_time
+    buckets = {}
     
     for event in events:
         event_type = event.event_type
@@ -247,17 +259,36 @@ def generate_report_summary(events):
             summary['object_detected_count'] += 1
             summary['detected_objects'].append(event.details)
         
-        summary['timeline'].append({
-            'time': event.timestamp.isoformat(),
-            'type': event_type,
-            'details': event.details
-        })
+        if resolution:
+            if origin is None:
+                origin = event.timestamp
+            index = int((event.timestamp - origin).total_seconds() // resolution)
+            counts = buckets.setdefault(index, {})
+            counts[event_type] = counts.get(event_type, 0) + 1
+        else:
+            summary['timeline'].append({
+                'time': event.timestamp.isoformat(),
+                'type': event_type,
+                'details': event.details
+            })
+    
+    if resolution:
+        summary['timeline'] = [
+            {
+                'start': (origin + timedelta(seconds=index * resolution)).isoformat(),
+                'counts': buckets[index]
+            }
+            for index in sorted(buckets)
+        ]
     
     return summary
 
 # Include the router in the main app
 app.include_router(api_router)
 
+# Compress large JSON payloads such as full session reports
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
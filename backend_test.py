@@ -261,7 +261,7 @@ class VideoProctoringAPITester:
         
         if success:
             # Verify report structure
-            required_fields = ['session', 'events', 'summary']
+            required_fields = ['session', 'summary']
             for field in required_fields:
                 if field not in response:
                     print(f"❌ Missing required field: {field}")
@@ -278,7 +278,26 @@ class VideoProctoringAPITester:
                     
             print(f"   Report generated with {summary['total_events']} events")
             
-        return success
+        # Bucketed timeline with the full event list
+        success2, response2 = self.run_test(
+            "Get Session Report (bucketed)",
+            "GET",
+            f"reports/{self.session_id}",
+            200,
+            params={"resolution": 60, "include_events": "true"}
+        )
+        
+        if success2:
+            if response2.get('events') is None:
+                print("❌ Events missing despite include_events")
+                return False
+            for bucket in response2['summary']['timeline']:
+                if 'start' not in bucket or 'counts' not in bucket:
+                    print(f"❌ Invalid timeline bucket: {bucket}")
+                    return False
+            print(f"   Timeline has {len(response2['summary']['timeline'])} buckets")
+            
+        return success and success2
 
     def test_status_endpoints(self):
         """Test status check endpoints"""
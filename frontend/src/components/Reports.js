@@ -29,6 +29,7 @@ import axios from "axios";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+const TIMELINE_RESOLUTION = 60; // seconds per timeline bucket
 
 export default function Reports() {
   const { sessionId } = useParams();
@@ -43,7 +44,9 @@ export default function Reports() {
   const fetchReport = async () => {
     try {
       setLoading(true);
-      const response = await axios.get(`${API}/reports/${sessionId}`);
+      const response = await axios.get(`${API}/reports/${sessionId}`, {
+        params: { resolution: TIMELINE_RESOLUTION }
+      });
       setReport(response.data);
     } catch (error) {
       console.error("Failed to fetch report:", error);
@@ -100,13 +103,25 @@ export default function Reports() {
     }
   };
 
-  const exportReport = () => {
+  const exportReport = async () => {
     if (!report) return;
 
+    let fullReport;
+    try {
+      const response = await axios.get(`${API}/reports/${sessionId}`, {
+        params: { include_events: true }
+      });
+      fullReport = response.data;
+    } catch (error) {
+      console.error("Failed to export report:", error);
+      toast.error("Failed to export report");
+      return;
+    }
+
     const reportData = {
-      session: report.session,
-      summary: report.summary,
-      events: report.events,
+      session: fullReport.session,
+      summary: fullReport.summary,
+      events: fullReport.events,
       generatedAt: new Date().toISOString()
     };
 
@@ -150,7 +165,7 @@ export default function Reports() {
     );
   }
 
-  const { session, events, summary } = report;
+  const { session, summary } = report;
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-50 to-blue-50 p-6">
@@ -435,28 +450,25 @@ export default function Reports() {
             Event Timeline
           </h3>
           
-          {events.length > 0 ? (
+          {summary.timeline.length > 0 ? (
             <div className="space-y-3 max-h-96 overflow-y-auto">
-              {events.map((event) => (
-                <div key={event.id} className="flex items-start gap-4 p-4 bg-white/50 rounded-lg hover:bg-white/70 transition-colors">
+              {summary.timeline.map((bucket) => (
+                <div key={bucket.start} className="flex items-start gap-4 p-4 bg-white/50 rounded-lg hover:bg-white/70 transition-colors">
                   <div className="flex-shrink-0 mt-1">
-                    {getEventIcon(event.event_type)}
+                    <Clock className="w-4 h-4 text-slate-500" />
                   </div>
                   <div className="flex-1">
-                    <div className="flex items-center gap-2 mb-1">
-                      <Badge className={getEventColor(event.event_type)}>
-                        {event.event_type.replace('_', ' ').toUpperCase()}
-                      </Badge>
-                      <span className="text-sm text-slate-500">
-                        {new Date(event.timestamp).toLocaleTimeString()}
-                      </span>
+                    <span className="text-sm text-slate-500">
+                      {new Date(bucket.start).toLocaleTimeString()}
+                    </span>
+                    <div className="flex flex-wrap items-center gap-2 mt-1">
+                      {Object.entries(bucket.counts).map(([eventType, count]) => (
+                        <Badge key={eventType} className={`${getEventColor(eventType)} flex items-center gap-1`}>
+                          {getEventIcon(eventType)}
+                          {eventType.replace('_', ' ').toUpperCase()} × {count}
+                        </Badge>
+                      ))}
                     </div>
-                    <p className="text-sm text-slate-700">{event.details}</p>
-                    {event.confidence < 1.0 && (
-                      <p className="text-xs text-slate-500 mt-1">
-                        Confidence: {(event.confidence * 100).toFixed(1)}%
-                      </p>
-                    )}
                   </div>
                 </div>
               ))}